@@ -25,7 +25,6 @@ var signupSchema = new mongoose.Schema({
     password: {type : String, required : true}
   });
 
-var Contact = mongoose.model('Contact', contactSchema);
 var Signup = mongoose.model('Signup', signupSchema);
 
 // EXPRESS SPECIFIC STUFF
@@ -36,6 +35,18 @@ app.use(express.urlencoded())
 app.set('view engine', 'pug') // Set the template engine as pug
 app.set('views', path.join(__dirname, 'views')) // Set the views directory
  
+// Save req.body as a new document of the given model and report the result
+function saveAndRespond(Model) {
+    return (req, res)=>{
+        var myData = new Model(req.body);
+        myData.save().then(()=>{
+            res.send("This item has been saved to the database")
+        }).catch(()=>{
+            res.status(400).send("Item was not saved to the database")
+        });
+    }
+}
+
 // ENDPOINTS
 app.get('/', (req, res)=>{ 
     const params = { }
@@ -52,14 +63,7 @@ app.get('/contact', (req, res)=>{
     res.status(200).render('contact.pug', params);
 })
 
-app.post('/contact', (req, res)=>{ 
-    var myData = new Contact(req.body);
-    myData.save().then(()=>{
-        res.send("This item has been saved to the database")
-    }).catch(()=>{
-        res.status(400).send("Item was not saved to the database")
-    });
-})
+app.post('/contact', saveAndRespond(Contact))
 const User = mongoose.model('Signups', {
     name: { type: String },
     password: { type: String }
@@ -69,9 +73,8 @@ const User = mongoose.model('Signups', {
 app.post('/login', async (req, res) => {
 
     try {
-        const check = await Signup.findOne({ name: req.body.name });
-        console.log(check)
-        if (check.password === req.body.password) {
+        const check = await Signup.findOne({ name: req.body.name }, 'password').lean();
+        if (check && check.password === req.body.password) {
             res.status(201).render("home.pug")
         }
 
@@ -84,14 +87,7 @@ app.post('/login', async (req, res) => {
     }
 });
 
-app.post('/signup', (req, res)=>{ 
-    var myData = new Signup(req.body);
-    myData.save().then(()=>{
-        res.send("This item has been saved to the database")
-    }).catch(()=>{
-        res.status(400).send("Item was not saved to the database")
-    });
-})
+app.post('/signup', saveAndRespond(Signup))
 
 // START THE SERVER
 app.listen(port, ()=>{